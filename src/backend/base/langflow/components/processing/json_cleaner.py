@@ -1,5 +1,8 @@
 import json
 import unicodedata
+from typing import Any
+
+from json_repair import repair_json
 
 from langflow.custom import Component
 from langflow.inputs import BoolInput, MessageTextInput
@@ -15,6 +18,9 @@ class JSONCleaner(Component):
         "so that they are fully compliant with the JSON spec."
     )
 
+    # Translation table that maps control characters to None
+    CONTROL_CHARS_TABLE = str.maketrans("", "", "".join(chr(i) for i in range(32)) + chr(127))
+
     inputs = [
         MessageTextInput(
             name="json_str", display_name="JSON String", info="The JSON string to be cleaned.", required=True
@@ -44,12 +50,6 @@ class JSONCleaner(Component):
     ]
 
     def clean_json(self) -> Message:
-        try:
-            from json_repair import repair_json
-        except ImportError as e:
-            msg = "Could not import the json_repair package. Please install it with `pip install json_repair`."
-            raise ImportError(msg) from e
-
         """Clean the input JSON string based on provided options and return the cleaned JSON string."""
         json_str = self.json_str
         remove_control_chars = self.remove_control_chars
@@ -69,10 +69,12 @@ class JSONCleaner(Component):
             if normalize_unicode:
                 json_str = self._normalize_unicode(json_str)
             if validate_json:
-                json_str = self._validate_json(json_str)
-
-            cleaned_json_str = repair_json(json_str)
-            result = str(cleaned_json_str)
+                # Input that already validates needs no repair; serialize the parsed
+                # object the same way repair_json would instead of parsing it again.
+                result = json.dumps(self._validate_json(json_str))
+            else:
+                cleaned_json_str = repair_json(json_str)
+                result = str(cleaned_json_str)
 
             self.status = result
             return Message(text=result)
@@ -82,22 +84,16 @@ class JSONCleaner(Component):
 
     def _remove_control_characters(self, s: str) -> str:
         """Remove control characters from the string."""
-        return s.translate(self.translation_table)
+        return s.translate(self.CONTROL_CHARS_TABLE)
 
     def _normalize_unicode(self, s: str) -> str:
         """Normalize Unicode characters in the string."""
         return unicodedata.normalize("NFC", s)
 
-    def _validate_json(self, s: str) -> str:
-        """Validate the JSON string."""
+    def _validate_json(self, s: str) -> Any:
+        """Validate the JSON string and return the parsed object."""
         try:
-            json.loads(s)
+            return json.loads(s)
         except json.JSONDecodeError as e:
             msg = f"Invalid JSON string: {e}"
             raise ValueError(msg) from e
-        return s
-
-    def __init__(self, *args, **kwargs):
-        # Create a translation table that maps control characters to None
-        super().__init__(*args, **kwargs)
-        self.translation_table = str.maketrans("", "", "".join(chr(i) for i in range(32)) + chr(127))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import atexit
 import os
-from collections import OrderedDict
+import threading
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -15,10 +16,14 @@ if TYPE_CHECKING:
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
+    from langfuse import Langfuse
 
     from langflow.graph.vertex.base import Vertex
     from langflow.services.tracing.schema import Log
 
+_clients: dict[tuple[tuple[str, str], ...], Langfuse] = {}
+_clients_lock = threading.Lock()
+
 
 class LangFuseTracer(BaseTracer):
     flow_id: str
@@ -29,7 +34,7 @@ class LangFuseTracer(BaseTracer):
         self.trace_type = trace_type
         self.trace_id = trace_id
         self.flow_id = trace_name.split(" - ")[-1]
-        self.spans: dict = OrderedDict()  # spans that are not ended
+        self.spans: dict = {}  # spans that are not ended
 
         config = self._get_config()
         self._ready: bool = self.setup_langfuse(config) if config else False
@@ -42,7 +47,15 @@ class LangFuseTracer(BaseTracer):
         try:
             from langfuse import Langfuse
 
-            self._client = Langfuse(**config)
+            # One client per configuration: each Langfuse client owns its own
+            # connection pool and background flush thread.
+            key = tuple(sorted(config.items()))
+            with _clients_lock:
+                if key not in _clients:
+                    _clients[key] = Langfuse(**config)
+                    # Shared clients outlive any single run, so drain them once at exit
+                    atexit.register(_clients[key].flush)
+                self._client = _clients[key]
             self.trace = self._client.trace(id=str(self.trace_id), name=self.flow_id)
 
         except ImportError:
@@ -65,13 +78,13 @@ class LangFuseTracer(BaseTracer):
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
     ) -> None:
-        start_time = datetime.now(tz=timezone.utc)
         if not self._ready:
             return
+        start_time = datetime.now(tz=timezone.utc)
 
-        metadata_: dict = {}
-        metadata_ |= {"trace_type": trace_type} if trace_type else {}
-        metadata_ |= metadata or {}
+        metadata_: dict = {"trace_type": trace_type} if trace_type else {}
+        if metadata:
+            metadata_.update(metadata)
 
         name = trace_name.removesuffix(f" ({trace_id})")
         content_span = {
@@ -81,11 +94,8 @@ class LangFuseTracer(BaseTracer):
             "start_time": start_time,
         }
 
-        if len(self.spans) > 0:
-            last_span = next(reversed(self.spans))
-            span = self.spans[last_span].span(**content_span)
-        else:
-            span = self.trace.span(**content_span)
+        parent = next(reversed(self.spans.values()), self.trace)
+        span = parent.span(**content_span)
 
         self.spans[trace_id] = span
 
@@ -98,16 +108,17 @@ class LangFuseTracer(BaseTracer):
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
     ) -> None:
-        end_time = datetime.now(tz=timezone.utc)
         if not self._ready:
             return
+        end_time = datetime.now(tz=timezone.utc)
 
         span = self.spans.pop(trace_id, None)
         if span:
-            output: dict = {}
-            output |= outputs or {}
-            output |= {"error": str(error)} if error else {}
-            output |= {"logs": list(logs)} if logs else {}
+            output: dict = {**outputs} if outputs else {}
+            if error:
+                output["error"] = str(error)
+            if logs:
+                output["logs"] = list(logs)
             content = {"output": output, "end_time": end_time}
             span.update(**content)
 
@@ -119,17 +130,17 @@ class LangFuseTracer(BaseTracer):
         error: Exception | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
-        if not self._ready:
-            return
-
-        self._client.flush()
+        # The client is shared across tracers: flushing it here would block this run
+        # until every concurrent flow's events are sent. Its background consumer
+        # delivers the queued spans, and the rest is flushed at interpreter exit.
+        return
 
     def get_langchain_callback(self) -> BaseCallbackHandler | None:
         if not self._ready:
             return None
 
         # get callback from parent span
-        stateful_client = self.spans[next(reversed(self.spans))] if len(self.spans) > 0 else self.trace
+        stateful_client = next(reversed(self.spans.values()), self.trace)
         return stateful_client.get_langchain_handler()
 
     @staticmethod
@@ -0,0 +1,48 @@
+import pytest
+from json_repair import repair_json
+from langflow.components.processing import JSONCleaner
+
+from tests.base import ComponentTestBaseWithoutClient
+
+
+class TestJSONCleaner(ComponentTestBaseWithoutClient):
+    @pytest.fixture
+    def component_class(self):
+        """Return the component class to test."""
+        return JSONCleaner
+
+    @pytest.fixture
+    def default_kwargs(self):
+        """Return the default kwargs for the component."""
+        return {"json_str": 'Here is the JSON: {"name": "test", "value": 1} Hope it helps!'}
+
+    @pytest.fixture
+    def file_names_mapping(self):
+        """Return the file names mapping for different versions."""
+        return []
+
+    @pytest.mark.parametrize(
+        "json_str",
+        [
+            '{"big": 123456789012345678901234567890}',
+            '{"a": NaN, "b": 1e400}',
+            '{"text": "café — 日本語"}',
+            '{"nested": {"list": [1, 2.5, null, true]}}',
+        ],
+    )
+    def test_validate_json_matches_repair_json(self, json_str):
+        """Test that validated input is serialized exactly as repair_json would."""
+        component = JSONCleaner()
+        component.set_attributes({"json_str": f"prefix {json_str} suffix", "validate_json": True})
+
+        result = component.clean_json()
+
+        assert result.text == repair_json(json_str)
+
+    def test_validate_json_invalid_input(self):
+        """Test that malformed input raises a ValueError when validation is enabled."""
+        component = JSONCleaner()
+        component.set_attributes({"json_str": '{"a": 1,, "b": }', "validate_json": True})
+
+        with pytest.raises(ValueError, match="Invalid JSON string"):
+            component.clean_json()
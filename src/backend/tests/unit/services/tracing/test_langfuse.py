@@ -0,0 +1,54 @@
+import sys
+import types
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from langflow.services.tracing import langfuse as langfuse_module
+from langflow.services.tracing.langfuse import LangFuseTracer
+
+
+@pytest.fixture
+def langfuse_class(monkeypatch):
+    """Replace the langfuse package with a stub whose Langfuse class builds a new mock client per call."""
+    fake_langfuse = types.ModuleType("langfuse")
+    fake_langfuse.Langfuse = MagicMock(side_effect=lambda **_: MagicMock())
+    monkeypatch.setitem(sys.modules, "langfuse", fake_langfuse)
+    monkeypatch.setattr(langfuse_module, "_clients", {})
+    monkeypatch.setattr(langfuse_module.atexit, "register", MagicMock())
+    return fake_langfuse.Langfuse
+
+
+def _create_tracer(monkeypatch, public_key: str) -> LangFuseTracer:
+    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "secret-key")
+    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", public_key)
+    monkeypatch.setenv("LANGFUSE_HOST", "http://localhost:3000")
+    return LangFuseTracer(trace_name="Flow - flow-id", trace_type="chain", project_name="test", trace_id=uuid4())
+
+
+def test_tracers_with_same_config_share_client(monkeypatch, langfuse_class):
+    first = _create_tracer(monkeypatch, "public-key")
+    second = _create_tracer(monkeypatch, "public-key")
+
+    assert first.ready
+    assert second.ready
+    assert first._client is second._client
+    langfuse_class.assert_called_once()
+
+
+def test_tracers_with_different_config_get_separate_clients(monkeypatch, langfuse_class):
+    first = _create_tracer(monkeypatch, "public-key-a")
+    second = _create_tracer(monkeypatch, "public-key-b")
+
+    assert first._client is not second._client
+    assert langfuse_class.call_count == 2
+
+
+@pytest.mark.usefixtures("langfuse_class")
+def test_end_does_not_flush_shared_client(monkeypatch):
+    tracer = _create_tracer(monkeypatch, "public-key")
+
+    tracer.end(inputs={}, outputs={})
+
+    tracer._client.flush.assert_not_called()
+    langfuse_module.atexit.register.assert_called_once_with(tracer._client.flush)